@@ -1,7 +1,7 @@
 import os
 import numpy as np
+from typing import Optional
 from langchain.chains import RetrievalQA
-from langchain_community.vectorstores import FAISS
 from langchain_community.embeddings import OpenAIEmbeddings
 from langchain_openai import ChatOpenAI
 
@@ -9,6 +9,14 @@ from unified_fetcher import UnifiedFinancialFetcher
 from retriever import PDFRetriever
 from alpha_model import AlphaModel
 from backtester import Backtester
+from risk_model import RiskModel
+
+STRATEGIES = {
+    "momentum": ("momentum_strategy", "signal_momentum", "Momentum Strategy"),
+    "mean reversion": ("mean_reversion_strategy", "signal_meanrev", "Mean Reversion Strategy"),
+    "crossover": ("moving_average_crossover", "signal_mac", "Moving Average Crossover"),
+    "factor": ("factor_model", "signal_factor", "Factor Model"),
+}
 
 
 class FinanceChatbot:
@@ -17,16 +25,19 @@ class FinanceChatbot:
 
         print("[Chatbot] Initializing components...")
         self.embedder = OpenAIEmbeddings()
-        self.vector_store = FAISS.load_local(
-            "faiss_index", self.embedder, allow_dangerous_deserialization=True
-        )
         self.retriever = PDFRetriever("faiss_index", self.embedder)
+        self.vector_store = self.retriever.vector_store
         self.llm = ChatOpenAI(model="gpt-4", temperature=0.3)
 
+        if self.retriever.partitions:
+            qa_retriever = self.retriever.as_retriever(k=3)
+        else:
+            qa_retriever = self.vector_store.as_retriever(
+                search_type="similarity", search_kwargs={"k": 3})
+
         self.qa_chain = RetrievalQA.from_chain_type(
             llm=self.llm,
-            retriever=self.vector_store.as_retriever(
-                search_type="similarity", search_kwargs={"k": 3}),
+            retriever=qa_retriever,
             return_source_documents=True,
         )
 
@@ -35,15 +46,46 @@ class FinanceChatbot:
         )
 
     def ask(self, query: str) -> str:
-        query_lower = query.lower()
+        route = self.route(query)
 
-        if any(kw in query_lower for kw in ["price", "stock", "crypto", "macroeconomic", "volatility", "returns", "gdp", "sharpe"]):
+        if route == "data":
             return self._answer_data_question(query)
-        elif any(kw in query_lower for kw in ["momentum", "mean reversion", "crossover", "factor"]):
+        elif route == "strategy":
             return self._run_strategy_pipeline(query)
         else:
             return self._answer_knowledge_question(query)
 
+    @staticmethod
+    def route(query: str) -> str:
+        query_lower = query.lower()
+
+        if any(kw in query_lower for kw in ["price", "stock", "crypto", "macroeconomic", "volatility", "returns", "gdp", "sharpe"]):
+            return "data"
+        elif any(kw in query_lower for kw in ["momentum", "mean reversion", "crossover", "factor"]):
+            return "strategy"
+        return "knowledge"
+
+    @staticmethod
+    def data_key(query: str) -> Optional[str]:
+        query_lower = query.lower()
+
+        if "price" in query_lower and "btc" in query_lower:
+            return "btc_price"
+        elif "price" in query_lower and "aapl" in query_lower:
+            return "aapl_price"
+        elif "sharpe" in query_lower:
+            return "aapl_sharpe"
+        elif "gdp" in query_lower:
+            return "gdp"
+        return None
+
+    @staticmethod
+    def strategy_key(query: str) -> Optional[str]:
+        for key in STRATEGIES:
+            if key in query:
+                return key
+        return None
+
     def _answer_knowledge_question(self, query: str) -> str:
         print("[Chatbot] Routing to PDF knowledge base...\n")
         result = self.qa_chain.invoke({"query": query})
@@ -51,17 +93,18 @@ class FinanceChatbot:
 
     def _answer_data_question(self, query: str) -> str:
         print("[Chatbot] Routing to live financial data...\n")
-        query_lower = query.lower()
+        return self._answer_data_key(self.data_key(query))
 
-        if "price" in query_lower and "btc" in query_lower:
+    def _answer_data_key(self, key: Optional[str]) -> str:
+        if key == "btc_price":
             return f"BTC/USD latest price: {self.fetcher.get_crypto_price():,.2f}"
 
-        elif "price" in query_lower and "aapl" in query_lower:
+        elif key == "aapl_price":
             df = self.fetcher.yf.get_price_data()
             close = df["Close"]["AAPL"] if "AAPL" in df["Close"] else df["Close"]
             return f"AAPL latest price: {close.iloc[-1]:,.2f}"
 
-        elif "sharpe" in query_lower:
+        elif key == "aapl_sharpe":
             stats = self.fetcher.get_stock_summary()
             ratio = stats["sharpe_ratio"]
             if hasattr(ratio, "values"):
@@ -70,39 +113,24 @@ class FinanceChatbot:
                 ratio = ratio[0]
             return f"AAPL Sharpe Ratio: {float(ratio):.4f}"
 
-        elif "gdp" in query_lower:
+        elif key == "gdp":
             gdp = self.fetcher.get_macro_data('GDP')
             return f"Latest GDP (FRED/GDP): {gdp.iloc[-1]:,.2f}"
 
         return "[Data Answer] Sorry, I couldn’t process that financial question."
 
-    def _run_strategy_pipeline(self, query: str) -> str:
-        print("[Chatbot] Running alpha strategy and backtest...\n")
-        alpha = AlphaModel()
-
-        if "momentum" in query:
-            df = alpha.momentum_strategy()
-            signal_col = "signal_momentum"
-            strategy_name = "Momentum Strategy"
-
-        elif "mean reversion" in query:
-            df = alpha.mean_reversion_strategy()
-            signal_col = "signal_meanrev"
-            strategy_name = "Mean Reversion Strategy"
-
-        elif "crossover" in query:
-            df = alpha.moving_average_crossover()
-            signal_col = "signal_mac"
-            strategy_name = "Moving Average Crossover"
+    def _run_strategy_pipeline(self, query: str, alpha: Optional[AlphaModel] = None) -> str:
+        return self.run_strategy_key(self.strategy_key(query), alpha=alpha)
 
-        elif "factor" in query:
-            df = alpha.factor_model()
-            signal_col = "signal_factor"
-            strategy_name = "Factor Model"
-
-        else:
+    def run_strategy_key(self, key: Optional[str], alpha: Optional[AlphaModel] = None) -> str:
+        print("[Chatbot] Running alpha strategy and backtest...\n")
+        if key is None:
             return "[Alpha] Strategy not recognized. Try: momentum, mean reversion, crossover, or factor."
 
+        alpha = alpha or AlphaModel()
+        method, signal_col, strategy_name = STRATEGIES[key]
+        df = getattr(alpha, method)()
+
         bt = Backtester(price_data=df, signal_column=signal_col)
         bt.run()
         metrics = bt.performance_metrics()
@@ -114,6 +142,29 @@ class FinanceChatbot:
             f"Sharpe Ratio: {metrics['Sharpe Ratio']:.2f}"
         )
 
+    def answer_data(self, query: str) -> str:
+        return self._answer_data_question(query)
+
+    def answer_data_key(self, key: Optional[str]) -> str:
+        return self._answer_data_key(key)
+
+    def answer_knowledge(self, query: str) -> str:
+        return self._answer_knowledge_question(query)
+
+    def run_strategy(self, query: str) -> str:
+        return self._run_strategy_pipeline(query)
+
+    def risk_report(self, confidence_level: float = 0.95) -> dict:
+        print("[Chatbot] Computing risk report...\n")
+        returns = self.fetcher.yf.get_returns()
+        model = RiskModel(returns)
+        return {
+            "sharpe_ratio": float(model.sharpe_ratio().iloc[0]),
+            "max_drawdown": float(model.max_drawdown().iloc[0]),
+            "value_at_risk": float(model.value_at_risk(confidence_level).iloc[0]),
+            "expected_shortfall": float(model.expected_shortfall(confidence_level).iloc[0]),
+        }
+
 
 # Test Block
 if __name__ == "__main__":
@@ -1,32 +1,58 @@
 import numpy as np
 import pandas as pd
+from typing import Dict, List, Optional, Tuple, Union
 from yfinance_fetcher import YFinanceFetcher
+from price_store import PriceStore
+from factor_engine import CrossSectionalFactorEngine
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report
 
 
 class AlphaModel:
-    def __init__(self):
-        self.fetcher = YFinanceFetcher(
-            ticker="AAPL", period="1y", interval="1d")
-        raw = self.fetcher.get_price_data().copy()
-
+    def __init__(self, data: Optional[Union[pd.DataFrame, PriceStore]] = None):
+        self.fetcher = None
+        self.store = None
+        self._data = None
+        if data is None:
+            self.fetcher = YFinanceFetcher(
+                ticker="AAPL", period="1y", interval="1d")
+            self._data = self._flatten(self.fetcher.get_price_data())
+        elif isinstance(data, PriceStore):
+            # Kept as compact arrays; strategies convert only the columns they read.
+            self.store = data
+        else:
+            self._data = self._flatten(data)
+
+    @staticmethod
+    def _flatten(raw: pd.DataFrame) -> pd.DataFrame:
+        raw = raw.copy(deep=False)
         raw.columns.name = None
         if isinstance(raw.columns, pd.MultiIndex):
             raw.columns = raw.columns.get_level_values(0)
-        self.data = raw
+        return raw
+
+    @property
+    def data(self) -> pd.DataFrame:
+        if self._data is None:
+            self._data = self.store.to_pandas()
+        return self._data
+
+    def _frame(self, columns: List[str]) -> pd.DataFrame:
+        if self._data is None and self.store is not None:
+            return self.store.select(columns).to_pandas().reset_index()
+        return self.data[columns].reset_index()
 
     def momentum_strategy(self, window=10):
         print("[AlphaModel] Running Momentum Strategy...")
-        df = self.data.copy().reset_index()
+        df = self._frame(["Close"])
         df["momentum"] = df["Close"] - df["Close"].shift(window)
         df["signal_momentum"] = np.where(df["momentum"] > 0, 1, -1)
         return df[["Close", "momentum", "signal_momentum"]].dropna()
 
     def mean_reversion_strategy(self, window=10):
         print("[AlphaModel] Running Mean Reversion Strategy...")
-        df = self.data.copy().reset_index()
+        df = self._frame(["Close"])
         df["rolling_mean"] = df["Close"].rolling(window=window).mean()
         df["rolling_std"] = df["Close"].rolling(window=window).std()
         df["z_score"] = (df["Close"] - df["rolling_mean"]) / df["rolling_std"]
@@ -36,7 +62,7 @@ class AlphaModel:
 
     def moving_average_crossover(self, short_window=5, long_window=20):
         print("[AlphaModel] Running Moving Average Crossover Strategy...")
-        df = self.data.copy().reset_index()
+        df = self._frame(["Close"])
         df["short_ma"] = df["Close"].rolling(window=short_window).mean()
         df["long_ma"] = df["Close"].rolling(window=long_window).mean()
         df["signal_mac"] = np.where(df["short_ma"] > df["long_ma"], 1, -1)
@@ -44,16 +70,26 @@ class AlphaModel:
 
     def factor_model(self):
         print("[AlphaModel] Running Simple Factor Model...")
-        df = self.data.copy().reset_index()
+        df = self._frame(["Close"])
         df["momentum"] = df["Close"].pct_change(periods=5)
         df["volatility"] = df["Close"].rolling(window=10).std()
         df["factor_score"] = df["momentum"] / df["volatility"]
         df["signal_factor"] = np.where(df["factor_score"] > 0, 1, -1)
         return df[["Close", "factor_score", "signal_factor"]].dropna()
 
+    def cross_sectional_factor_model(self, prices: pd.DataFrame, sectors: Optional[Dict[str, str]] = None,
+                                     weights: Optional[Dict[str, float]] = None, quantile: float = 0.2,
+                                     transaction_cost: float = 0.001) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        print("[AlphaModel] Running Cross-Sectional Factor Model...")
+        engine = CrossSectionalFactorEngine(prices, sectors=sectors)
+        score = engine.composite(weights=weights)
+        portfolio_weights = engine.long_short_weights(score, quantile=quantile)
+        results = engine.backtest(portfolio_weights, transaction_cost=transaction_cost)
+        return portfolio_weights, results
+
     def machine_learning_model(self):
         print("[AlphaModel] Running ML Model (Random Forest)...")
-        df = self.data.copy().reset_index()
+        df = self._frame(["Close"])
         df["returns"] = df["Close"].pct_change()
         df["ma10"] = df["Close"].rolling(window=10).mean()
         df["ma50"] = df["Close"].rolling(window=50).mean()
@@ -1,18 +1,36 @@
 import pandas as pd
-import numpy as np
+from typing import List, Optional, Union
+from price_store import PriceStore
+from execution_kernel import run_execution
+from significance import SignificanceTester
+from performance_analytics import PerformanceAnalytics
 
 
 class Backtester:
-    def __init__(self, price_data: pd.DataFrame, signal_column: str, transaction_cost: float = 0.001):
-        self.data = price_data.copy()
+    def __init__(self, price_data: Union[pd.DataFrame, PriceStore], signal_column: str, transaction_cost: float = 0.001):
+        # A PriceStore stays as compact arrays until a run asks for specific columns.
+        # Frames are only shallow-copied since runs add columns and never mutate inputs.
+        self.store = price_data if isinstance(price_data, PriceStore) else None
+        self._data = None if self.store is not None else price_data
         self.signal_column = signal_column
         self.transaction_cost = transaction_cost
         self.results = None
 
+    @property
+    def data(self) -> pd.DataFrame:
+        if self._data is None:
+            self._data = self.store.to_pandas()
+        return self._data
+
+    def _frame(self, columns: List[str]) -> pd.DataFrame:
+        if self._data is None:
+            return self.store.select([c for c in columns if c in self.store]).to_pandas()
+        return self.data.copy(deep=False)
+
     def run(self, initial_capital: float = 100000):
         print(
             f"[Backtester] Running backtest with capital = ${initial_capital:,.2f} and TC = {self.transaction_cost*100:.2f}%")
-        df = self.data.copy()
+        df = self._frame(["Close", self.signal_column])
 
 
         df["returns"] = df["Close"].pct_change()
@@ -30,23 +48,76 @@ class Backtester:
         self.results = df.dropna()
         return self.results
 
+    def run_with_rules(self, initial_capital: float = 100000, stop_loss: Optional[float] = None,
+                       take_profit: Optional[float] = None, target_vol: Optional[float] = None,
+                       vol_window: int = 20, max_leverage: float = 1.0, impact: float = 0.0):
+        print(
+            f"[Backtester] Running path-dependent backtest with capital = ${initial_capital:,.2f} and TC = {self.transaction_cost*100:.2f}%")
+        df = self._frame(["Open", "High", "Low", "Close", "Volume", self.signal_column])
+
+        returns, position, trade, strategy_returns, exits = run_execution(
+            df["Close"].to_numpy(),
+            df[self.signal_column].to_numpy(),
+            transaction_cost=self.transaction_cost,
+            high=df["High"].to_numpy() if "High" in df else None,
+            low=df["Low"].to_numpy() if "Low" in df else None,
+            volume=df["Volume"].to_numpy() if "Volume" in df else None,
+            open_=df["Open"].to_numpy() if "Open" in df else None,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            target_vol=target_vol,
+            vol_window=vol_window,
+            max_leverage=max_leverage,
+            impact=impact,
+            initial_capital=initial_capital,
+        )
+
+        df["returns"] = returns
+        df["position"] = position
+        df["trade"] = trade
+        df["strategy_returns"] = strategy_returns
+        df["exit"] = exits
+
+        df["portfolio_value"] = (
+            1 + df["strategy_returns"]).cumprod() * initial_capital
+        df["cumulative_market"] = (
+            1 + df["returns"]).cumprod() * initial_capital
+
+        self.results = df.dropna()
+        return self.results
+
     def performance_metrics(self):
-        df = self.results.copy()
+        metrics = self.extended_metrics()
 
-        total_return = df["portfolio_value"].iloc[-1] / \
-            df["portfolio_value"].iloc[0] - 1
-        annualized_return = (1 + total_return) ** (252 / len(df)) - 1
-        volatility = df["strategy_returns"].std() * np.sqrt(252)
-        sharpe_ratio = annualized_return / volatility if volatility != 0 else np.nan
-        drawdown = (df["portfolio_value"] / df["portfolio_value"].cummax()) - 1
-        max_drawdown = drawdown.min()
+        return {
+            "Total Return": metrics["Total Return"],
+            "Annualized Return": metrics["Annualized Return"],
+            "Volatility": metrics["Volatility"],
+            "Sharpe Ratio": metrics["Sharpe Ratio"],
+            "Max Drawdown": metrics["Max Drawdown"]
+        }
 
+    def extended_metrics(self, rolling_window: int = 63) -> pd.Series:
+        df = self.results
+        analytics = PerformanceAnalytics(
+            df["strategy_returns"].rename("Strategy"), positions=df["position"].rename("Strategy"),
+            rolling_window=rolling_window)
+        return analytics.compute().iloc[0]
+
+    def significance(self, n_resamples: int = 10000, n_trials: int = 1, method: str = "stationary",
+                     block_size: Optional[float] = None, confidence: float = 0.95,
+                     n_jobs: Optional[int] = None, seed: Optional[int] = None):
+        df = self.results
+        # Only commissions are fixed per period; stop/target fills depend on the price path.
+        costs = df["trade"] * self.transaction_cost
+        tester = SignificanceTester(
+            df["strategy_returns"], position=df["position"], market_returns=df["returns"])
         return {
-            "Total Return": total_return,
-            "Annualized Return": annualized_return,
-            "Volatility": volatility,
-            "Sharpe Ratio": sharpe_ratio,
-            "Max Drawdown": max_drawdown
+            "bootstrap": tester.bootstrap(n_resamples=n_resamples, method=method, block_size=block_size,
+                                          confidence=confidence, n_jobs=n_jobs, seed=seed),
+            "permutation": tester.permutation_test(
+                n_permutations=n_resamples, transaction_costs=costs.to_numpy(), n_jobs=n_jobs, seed=seed),
+            "deflated_sharpe": tester.deflated_sharpe(n_trials=n_trials),
         }
 
     def summary(self):
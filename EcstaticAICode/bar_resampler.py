@@ -0,0 +1,220 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+
+BAR_COLUMNS = ["open", "high", "low", "close", "volume", "dollar_volume", "vwap", "ticks"]
+
+
+def _to_epoch_ns(df: pd.DataFrame) -> np.ndarray:
+    if "timestamp" in df.columns:
+        return pd.to_datetime(df["timestamp"], unit="ms").to_numpy(dtype="datetime64[ns]").view(np.int64)
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.as_unit("ns").asi8
+
+
+def _column(df: pd.DataFrame, *names: str) -> Optional[np.ndarray]:
+    labels = df.columns.get_level_values(0) if isinstance(
+        df.columns, pd.MultiIndex) else df.columns
+    lookup = {str(c).lower(): i for i, c in enumerate(labels)}
+    for name in names:
+        if name in lookup:
+            return df.iloc[:, lookup[name]].to_numpy(dtype=np.float64)
+    return None
+
+
+def _extract(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    ts = _to_epoch_ns(df)
+    price = _column(df, "price", "close")
+    size = _column(df, "amount", "volume", "size")
+    if price is None or size is None:
+        raise ValueError(
+            "Expected trade columns (price, amount) or OHLCV columns (close, volume)")
+
+    open_ = _column(df, "open")
+    high = _column(df, "high")
+    low = _column(df, "low")
+    return {
+        "ts": ts,
+        "open": price if open_ is None else open_,
+        "high": price if high is None else high,
+        "low": price if low is None else low,
+        "close": price,
+        "volume": size,
+        "dollar": price * size,
+    }
+
+
+def _aggregate(cols: Dict[str, np.ndarray], starts: np.ndarray, ends: np.ndarray) -> pd.DataFrame:
+    if len(starts) == 0:
+        return pd.DataFrame(columns=BAR_COLUMNS, index=pd.DatetimeIndex([], name="datetime"))
+
+    # Bars are contiguous, so reduceat only needs rows up to the last close;
+    # anything after it belongs to an unfinished bar.
+    cols = {k: v[:ends[-1]] for k, v in cols.items()}
+    volume = np.add.reduceat(cols["volume"], starts)
+    dollar = np.add.reduceat(cols["dollar"], starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        vwap = np.where(volume > 0, dollar / volume, cols["close"][ends - 1])
+
+    ts = cols["ts"][ends - 1]
+    bars = pd.DataFrame({
+        "open": cols["open"][starts],
+        "high": np.maximum.reduceat(cols["high"], starts),
+        "low": np.minimum.reduceat(cols["low"], starts),
+        "close": cols["close"][ends - 1],
+        "volume": volume,
+        "dollar_volume": dollar,
+        "vwap": vwap,
+        "ticks": ends - starts,
+    }, index=pd.DatetimeIndex(ts.view("datetime64[ns]"), name="datetime"))
+    return bars
+
+
+def _threshold_boundaries(values: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray, int]:
+    # A bar closes on the row that lifts its running total to the threshold,
+    # then the total resets. The reset makes this path-dependent, so it loops
+    # once per bar (not per row), each step a binary search on the cumsum.
+    if not threshold > 0:
+        raise ValueError(f"Bar threshold must be positive, got {threshold}.")
+    cum = np.cumsum(values)
+    starts, ends = [], []
+    start, base = 0, 0.0
+    n = len(cum)
+    while start < n:
+        end = int(np.searchsorted(cum, base + threshold, side="left")) + 1
+        # Guards against thresholds below the float spacing of the running total.
+        end = max(end, start + 1)
+        if end > n:
+            break
+        starts.append(start)
+        ends.append(end)
+        base = cum[end - 1]
+        start = end
+    return np.asarray(starts, dtype=np.int64), np.asarray(ends, dtype=np.int64), start
+
+
+def _time_boundaries(ts: np.ndarray, freq_ns: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    buckets = ts // freq_ns
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(ts)]
+    return starts, ends, buckets[starts] * freq_ns
+
+
+def time_bars(data: pd.DataFrame, freq: str = "1h") -> pd.DataFrame:
+    cols = _extract(data)
+    if len(cols["ts"]) == 0:
+        return _aggregate(cols, np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+    starts, ends, labels = _time_boundaries(cols["ts"], pd.Timedelta(freq).value)
+    bars = _aggregate(cols, starts, ends)
+    bars.index = pd.DatetimeIndex(labels.view("datetime64[ns]"), name="datetime")
+    return bars
+
+
+def volume_bars(data: pd.DataFrame, threshold: float) -> pd.DataFrame:
+    cols = _extract(data)
+    starts, ends, _ = _threshold_boundaries(cols["volume"], threshold)
+    return _aggregate(cols, starts, ends)
+
+
+def dollar_bars(data: pd.DataFrame, threshold: float) -> pd.DataFrame:
+    cols = _extract(data)
+    starts, ends, _ = _threshold_boundaries(cols["dollar"], threshold)
+    return _aggregate(cols, starts, ends)
+
+
+class BarResampler:
+    def __init__(self, bar_type: str = "dollar", threshold: Optional[float] = None, freq: Optional[str] = None):
+        self.bar_type = bar_type.lower()
+        if self.bar_type not in ("time", "volume", "dollar"):
+            raise ValueError(f"Unsupported bar type '{bar_type}'. Use time, volume, or dollar.")
+        if self.bar_type == "time" and freq is None:
+            raise ValueError("Time bars require a freq such as '5min' or '1h'.")
+        if self.bar_type != "time" and threshold is None:
+            raise ValueError(f"{self.bar_type.capitalize()} bars require a threshold.")
+        if self.bar_type != "time" and not threshold > 0:
+            raise ValueError(f"Bar threshold must be positive, got {threshold}.")
+
+        self.threshold = threshold
+        self.freq_ns = pd.Timedelta(freq).value if freq else None
+        self._pending: Optional[Dict[str, np.ndarray]] = None
+
+    def _merge(self, cols: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        if self._pending is None:
+            return cols
+        return {k: np.concatenate([self._pending[k], cols[k]]) for k in cols}
+
+    def update(self, data: pd.DataFrame) -> pd.DataFrame:
+        cols = self._merge(_extract(data))
+        if len(cols["ts"]) == 0:
+            return _aggregate(cols, np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+
+        if self.bar_type == "time":
+            starts, ends, labels = _time_boundaries(cols["ts"], self.freq_ns)
+            # The last bucket stays open until data from a later bucket arrives.
+            starts, ends, labels = starts[:-1], ends[:-1], labels[:-1]
+            done = int(ends[-1]) if len(ends) else 0
+            bars = _aggregate(cols, starts, ends)
+            bars.index = pd.DatetimeIndex(labels.view("datetime64[ns]"), name="datetime")
+        else:
+            key = "volume" if self.bar_type == "volume" else "dollar"
+            starts, ends, done = _threshold_boundaries(cols[key], self.threshold)
+            bars = _aggregate(cols, starts, ends)
+
+        self._pending = {k: v[done:] for k, v in cols.items()}
+        return bars
+
+    def flush(self) -> pd.DataFrame:
+        if self._pending is None or len(self._pending["ts"]) == 0:
+            self._pending = None
+            return _aggregate({}, np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+
+        cols, self._pending = self._pending, None
+        n = len(cols["ts"])
+        bars = _aggregate(cols, np.array([0]), np.array([n]))
+        if self.bar_type == "time":
+            label = (cols["ts"][0] // self.freq_ns) * self.freq_ns
+            bars.index = pd.DatetimeIndex(np.array([label]).view("datetime64[ns]"), name="datetime")
+        return bars
+
+    def pending_rows(self) -> int:
+        return 0 if self._pending is None else len(self._pending["ts"])
+
+
+# Test block
+if __name__ == "__main__":
+    import time
+
+    print("[Testing BarResampler...]")
+
+    np.random.seed(42)
+    n = 2_000_000
+    trades = pd.DataFrame({
+        "timestamp": 1_700_000_000_000 + np.cumsum(np.random.randint(1, 50, n)),
+        "price": 30000 * np.exp(np.cumsum(np.random.normal(0, 1e-4, n))),
+        "amount": np.random.exponential(0.05, n),
+    })
+
+    start = time.perf_counter()
+    bars = dollar_bars(trades, threshold=5_000_000)
+    print(f"\n[Dollar bars: {len(bars):,} bars from {n:,} trades in {time.perf_counter() - start:.3f}s]")
+    print(bars.head())
+
+    print("\n[5-minute time bars]")
+    print(time_bars(trades, "5min").head())
+
+    print("\n[Streaming volume bars in 4 chunks]")
+    stream = BarResampler("volume", threshold=500)
+    chunks = [trades.iloc[i:i + n // 4] for i in range(0, n, n // 4)]
+    streamed = pd.concat([stream.update(chunk) for chunk in chunks] + [stream.flush()])
+
+    # Batch bars drop the trailing rows that never reach the threshold; flush() emits them as one bar.
+    batch = volume_bars(trades, threshold=500)
+    _, _, done = _threshold_boundaries(trades["amount"].to_numpy(), 500)
+    remainder = trades.iloc[done:]
+    batch = pd.concat([batch, _aggregate(_extract(remainder), np.array([0]), np.array([len(remainder)]))])
+    match = len(streamed) == len(batch) and all(
+        np.allclose(streamed[c].to_numpy(dtype=np.float64), batch[c].to_numpy(dtype=np.float64))
+        for c in BAR_COLUMNS) and streamed.index.equals(batch.index)
+    print(f"streamed={len(streamed):,} batch={len(batch):,} match={match}")
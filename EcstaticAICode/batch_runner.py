@@ -0,0 +1,136 @@
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from alpha_model import AlphaModel
+
+
+class BatchRunner:
+    def __init__(self, bot: Any, max_workers: int = 8, verbose: bool = True):
+        self.bot = bot
+        self.max_workers = max_workers
+        self.verbose = verbose
+        self.report: Dict[str, Any] = {}
+
+    def plan(self, queries: List[str]) -> Dict[Tuple[str, Optional[str]], List[int]]:
+        groups: Dict[Tuple[str, Optional[str]], List[int]] = {}
+        for i, query in enumerate(queries):
+            route = self.bot.route(query)
+            if route == "data":
+                key = self.bot.data_key(query)
+            elif route == "strategy":
+                key = self.bot.strategy_key(query)
+            else:
+                key = query.strip()
+            groups.setdefault((route, key), []).append(i)
+        return groups
+
+    def _task(self, route: str, key: Optional[str], alpha: Optional[Future]) -> Callable[[], str]:
+        if route == "data":
+            return lambda: self.bot.answer_data_key(key)
+        if route == "strategy":
+            if key is None:
+                return lambda: self.bot.run_strategy_key(None)
+            return lambda: self.bot.run_strategy_key(key, alpha=alpha.result())
+        return lambda: self.bot.answer_knowledge(key)
+
+    def run(self, queries: List[str]) -> Iterator[Tuple[int, str, str]]:
+        start = time.perf_counter()
+        groups = self.plan(queries)
+        plan_seconds = time.perf_counter() - start
+
+        timings: Dict[str, float] = {}
+        lock = threading.Lock()
+
+        def timed(route: str, func: Callable[[], Any]) -> Callable[[], Any]:
+            def wrapper():
+                t0 = time.perf_counter()
+                try:
+                    return func()
+                finally:
+                    with lock:
+                        timings[route] = timings.get(route, 0.0) + time.perf_counter() - t0
+            return wrapper
+
+        if self.verbose:
+            print(f"[Batch] {len(queries)} queries planned into {len(groups)} unique tasks")
+
+        by_query: Dict[int, Future] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            alpha = None
+            if any(route == "strategy" and key is not None for route, key in groups):
+                # Reuse the bot's cached price download instead of fetching again.
+                alpha = pool.submit(timed("price_data", lambda: AlphaModel(self.bot.fetcher.yf.get_price_data())))
+
+            for (route, key), indices in groups.items():
+                future = pool.submit(timed(route, self._task(route, key, alpha)))
+                for i in indices:
+                    by_query[i] = future
+
+            for i, query in enumerate(queries):
+                try:
+                    answer = by_query[i].result()
+                except Exception as e:
+                    answer = f"[Batch Error] {type(e).__name__}: {e}"
+                yield i, query, answer
+
+        counts: Dict[str, Dict[str, int]] = {}
+        for (route, _), indices in groups.items():
+            entry = counts.setdefault(route, {"queries": 0, "unique": 0})
+            entry["queries"] += len(indices)
+            entry["unique"] += 1
+
+        self.report = {
+            "queries": len(queries),
+            "unique_tasks": len(groups),
+            "plan_seconds": plan_seconds,
+            "wall_seconds": time.perf_counter() - start,
+            "routes": {route: {**entry, "task_seconds": timings.get(route, 0.0)}
+                       for route, entry in counts.items()},
+        }
+        if "price_data" in timings:
+            self.report["price_data_seconds"] = timings["price_data"]
+
+        if self.verbose:
+            self.print_report()
+
+    def run_file(self, path: str) -> Iterator[Tuple[int, str, str]]:
+        with open(path) as f:
+            queries = [line.strip() for line in f if line.strip()]
+        return self.run(queries)
+
+    def print_report(self):
+        report = self.report
+        print("\n--- Batch Timing Report ---")
+        print(f"Queries: {report['queries']} | Unique tasks: {report['unique_tasks']} | "
+              f"Wall time: {report['wall_seconds']:.2f}s")
+        for route, entry in report["routes"].items():
+            print(f"{route:>10}: {entry['queries']} queries -> {entry['unique']} tasks, "
+                  f"{entry['task_seconds']:.2f}s task time")
+        if "price_data_seconds" in report:
+            print(f"{'price data':>10}: fetched once in {report['price_data_seconds']:.2f}s")
+
+
+# Test Block
+if __name__ == "__main__":
+    import os
+    from EcstaticAI import FinanceChatbot
+
+    print("[Testing BatchRunner...]")
+
+    bot = FinanceChatbot(openai_api_key=os.environ.get("OPENAI_API_KEY", ""))
+    runner = BatchRunner(bot, max_workers=8)
+
+    questions = [
+        "What is the latest AAPL stock price?",
+        "Run momentum strategy and backtest it.",
+        "What is the Black-Scholes formula for option pricing?",
+        "What is the latest AAPL stock price?",
+        "Run mean reversion strategy and backtest it.",
+        "Show me the latest GDP number.",
+        "Run momentum strategy and backtest it again.",
+        "What is the Sharpe Ratio for AAPL?",
+    ]
+
+    for i, query, answer in runner.run(questions):
+        print(f"\n[{i}] {query}\n{answer}")
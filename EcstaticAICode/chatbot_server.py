@@ -0,0 +1,274 @@
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+
+class LatencyTracker:
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self.samples: Dict[str, Deque[float]] = {}
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, endpoint: str, seconds: float, ok: bool = True):
+        self.samples.setdefault(endpoint, deque(maxlen=self.window)).append(seconds)
+        self.counts[endpoint] = self.counts.get(endpoint, 0) + 1
+        if not ok:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        report = {}
+        for endpoint, samples in self.samples.items():
+            ordered = sorted(samples)
+            n = len(ordered)
+            report[endpoint] = {
+                "count": self.counts[endpoint],
+                "errors": self.errors.get(endpoint, 0),
+                "mean_ms": 1000 * sum(ordered) / n,
+                "p50_ms": 1000 * ordered[n // 2],
+                "p95_ms": 1000 * ordered[min(n - 1, int(0.95 * n))],
+                "max_ms": 1000 * ordered[-1],
+            }
+        return report
+
+
+class ServerBusy(Exception):
+    pass
+
+
+class PayloadTooLarge(Exception):
+    pass
+
+
+class ChatbotServer:
+    def __init__(self, bot: Any, host: str = "127.0.0.1", port: int = 8000, workers: int = 4,
+                 queue_size: int = 64, request_timeout: float = 300.0, max_body_bytes: int = 64 * 1024):
+        self.bot = bot
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.queue_size = queue_size
+        self.request_timeout = request_timeout
+        self.max_body_bytes = max_body_bytes
+
+        self.latency = LatencyTracker()
+        self.coalesced = 0
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chatbot")
+        self._queue: Optional[asyncio.Queue] = None
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._worker_tasks = []
+        self._server: Optional[asyncio.AbstractServer] = None
+
+        self.routes: Dict[str, Tuple[Callable[..., Any], Tuple[str, ...]]] = {
+            "/ask": (lambda p: self.bot.ask(p["query"]), ("query",)),
+            "/data": (lambda p: self.bot.answer_data(p["query"]), ("query",)),
+            "/strategy": (lambda p: self.bot.run_strategy(p["name"]), ("name",)),
+            "/risk": (lambda p: self.bot.risk_report(float(p.get("confidence", 0.95))), ()),
+        }
+
+    async def start(self):
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._worker_tasks = [asyncio.create_task(self._worker())
+                              for _ in range(self.workers)]
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        print(f"[Server] Listening on http://{self.host}:{self.port} "
+              f"({self.workers} workers, queue size {self.queue_size})")
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._executor.shutdown(wait=False)
+        print("[Server] Stopped.")
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            func, params, future = await self._queue.get()
+            try:
+                result = await loop.run_in_executor(self._executor, func, params)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    async def submit(self, endpoint: str, params: Dict[str, str]) -> Any:
+        func, required = self.routes[endpoint]
+        missing = [name for name in required if name not in params]
+        if missing:
+            raise ValueError(f"Missing parameter(s): {', '.join(missing)}")
+
+        key = (endpoint, json.dumps(params, sort_keys=True))
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.wait_for(asyncio.shield(future), self.request_timeout)
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((func, params, future))
+        except asyncio.QueueFull:
+            raise ServerBusy(f"Request queue is full ({self.queue_size} pending)")
+
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.wait_for(asyncio.shield(future), self.request_timeout)
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str]]:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        if not request_line:
+            raise ConnectionError("Empty request")
+        method, target, _ = request_line.split(" ", 2)
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        url = urlsplit(target)
+        params = dict(parse_qsl(url.query))
+        length = int(headers.get("content-length", 0))
+        if length < 0:
+            raise ValueError(f"Invalid Content-Length {length}")
+        if length > self.max_body_bytes:
+            raise PayloadTooLarge(f"Request body exceeds {self.max_body_bytes} bytes")
+        if length:
+            body = await reader.readexactly(length)
+            payload = json.loads(body.decode("utf-8"))
+            if not isinstance(payload, dict):
+                raise ValueError("Request body must be a JSON object")
+            params.update(payload)
+        return method.upper(), url.path, params
+
+    async def _write_response(self, writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any]):
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large",
+                   500: "Internal Server Error", 503: "Service Unavailable", 504: "Gateway Timeout"}
+        body = json.dumps(payload, default=str).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {reasons.get(status, 'OK')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n")
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write(head.encode("latin-1") + b"\r\n" + body)
+        await writer.drain()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        start = time.perf_counter()
+        endpoint = "unknown"
+        status = 200
+        try:
+            method, endpoint, params = await self._read_request(reader)
+            if endpoint == "/health":
+                payload = {"status": "ok", "queued": self._queue.qsize(),
+                           "inflight": len(self._inflight)}
+            elif endpoint == "/stats":
+                payload = {"latency": self.latency.snapshot(), "coalesced": self.coalesced,
+                           "queued": self._queue.qsize()}
+            elif endpoint in self.routes and method in ("GET", "POST"):
+                payload = {"result": await self.submit(endpoint, params)}
+            else:
+                status, payload = 404, {"error": f"Unknown endpoint {method} {endpoint}"}
+        except (ValueError, json.JSONDecodeError) as e:
+            status, payload = 400, {"error": str(e)}
+        except PayloadTooLarge as e:
+            status, payload = 413, {"error": str(e)}
+        except ServerBusy as e:
+            status, payload = 503, {"error": str(e)}
+        except asyncio.TimeoutError:
+            status, payload = 504, {"error": "Request timed out"}
+        except (ConnectionError, asyncio.IncompleteReadError):
+            writer.close()
+            return
+        except Exception as e:
+            status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+
+        try:
+            await self._write_response(writer, status, payload)
+        finally:
+            writer.close()
+            if endpoint in self.routes:
+                self.latency.record(endpoint, time.perf_counter() - start, ok=status == 200)
+
+
+def run_server(bot: Any, host: str = "127.0.0.1", port: int = 8000, workers: int = 4, queue_size: int = 64):
+    server = ChatbotServer(bot, host=host, port=port, workers=workers, queue_size=queue_size)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\n[Server] Shutting down.")
+
+
+# Test block
+if __name__ == "__main__":
+    print("[Testing ChatbotServer with a stubbed bot...]")
+
+    class StubBot:
+        def __init__(self):
+            self.calls = 0
+
+        def ask(self, query: str) -> str:
+            self.calls += 1
+            time.sleep(0.2)
+            return f"[Stub Answer] {query}"
+
+        def answer_data(self, query: str) -> str:
+            return f"[Stub Data] {query}"
+
+        def run_strategy(self, query: str) -> str:
+            self.calls += 1
+            time.sleep(0.3)
+            return f"[Stub Strategy] {query}"
+
+        def risk_report(self, confidence_level: float = 0.95) -> dict:
+            return {"value_at_risk": -0.021, "confidence": confidence_level}
+
+    async def request(port: int, path: str, body: Optional[dict] = None) -> dict:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        data = json.dumps(body).encode() if body else b""
+        method = "POST" if body else "GET"
+        writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+                     f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+        await writer.drain()
+        raw = await reader.read()
+        writer.close()
+        return json.loads(raw.split(b"\r\n\r\n", 1)[1])
+
+    async def demo():
+        bot = StubBot()
+        server = ChatbotServer(bot, port=0, workers=2, queue_size=8)
+        await server.start()
+
+        replies = await asyncio.gather(
+            *[request(server.port, "/ask", {"query": "What is CAPM?"}) for _ in range(5)],
+            request(server.port, "/strategy?name=momentum"),
+            request(server.port, "/risk"),
+        )
+        for reply in replies:
+            print(reply)
+
+        print(f"\n[Backend calls: {bot.calls}, coalesced: {server.coalesced}]")
+        print(json.dumps(await request(server.port, "/stats"), indent=2))
+        await server.stop()
+
+    asyncio.run(demo())
@@ -1,12 +1,18 @@
 import ccxt
+import numpy as np
 import pandas as pd
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
+from price_store import PriceStore
+from bar_resampler import time_bars, volume_bars, dollar_bars
+from transport import LiveTransport, default_transport
 
 
 class CryptoFetcher:
-    def __init__(self, exchange_name: str = "coinbase", rate_limit: float = 1.5):
+    def __init__(self, exchange_name: str = "coinbase", rate_limit: float = 1.5,
+                 transport: Optional[LiveTransport] = None):
         self.exchange_name = exchange_name.lower()
+        self.transport = transport or default_transport()
         self.exchange = self._load_exchange()
         self.rate_limit = rate_limit
         self.last_call = 0.0
@@ -18,38 +24,77 @@ class CryptoFetcher:
             if not exchange.has.get("fetchOHLCV", False):
                 raise ValueError(
                     f"{self.exchange_name} does not support OHLCV.")
-            exchange.load_markets()
+            self.symbols = self.transport.fetch(
+                f"ccxt.{self.exchange_name}.symbols", {},
+                lambda: list(exchange.load_markets().keys()))
             return exchange
         except Exception as e:
             raise RuntimeError(
                 f"Failed to load exchange {self.exchange_name}: {str(e)}")
 
     def _throttle(self):
+        if self.transport.offline:
+            return
         elapsed = time.time() - self.last_call
         if elapsed < self.rate_limit:
             time.sleep(self.rate_limit - elapsed)
         self.last_call = time.time()
 
     def get_supported_symbols(self) -> List[str]:
-        return list(self.exchange.symbols)
+        return list(self.symbols)
 
     def fetch_ohlcv(self, symbol: str = "BTC/USD", timeframe: str = "1d", limit: int = 90) -> pd.DataFrame:
         self._throttle()
-        if symbol not in self.exchange.symbols:
+        if symbol not in self.symbols:
             raise ValueError(
                 f"Symbol {symbol} not supported by {self.exchange_name}")
 
-        ohlcv = self.exchange.fetch_ohlcv(
-            symbol, timeframe=timeframe, limit=limit)
+        ohlcv = self.transport.fetch(
+            f"ccxt.{self.exchange_name}.ohlcv",
+            {"symbol": symbol, "timeframe": timeframe, "limit": limit},
+            lambda: self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit))
         df = pd.DataFrame(
             ohlcv, columns=["timestamp", "open", "high", "low", "close", "volume"])
         df["datetime"] = pd.to_datetime(df["timestamp"], unit="ms")
         df.set_index("datetime", inplace=True)
         return df[["open", "high", "low", "close", "volume"]]
 
+    def fetch_ohlcv_store(self, symbol: str = "BTC/USD", timeframe: str = "1d", limit: int = 90,
+                          dtype: Union[str, np.dtype] = np.float32) -> PriceStore:
+        return PriceStore.from_frame(self.fetch_ohlcv(symbol, timeframe, limit), dtype=dtype)
+
+    def fetch_trades(self, symbol: str = "BTC/USD", since: Optional[int] = None, limit: int = 1000) -> pd.DataFrame:
+        self._throttle()
+        if not self.exchange.has.get("fetchTrades", False):
+            raise ValueError(f"{self.exchange_name} does not support trade history.")
+
+        trades = self.transport.fetch(
+            f"ccxt.{self.exchange_name}.trades",
+            {"symbol": symbol, "since": since, "limit": limit},
+            lambda: self.exchange.fetch_trades(symbol, since=since, limit=limit))
+        df = pd.DataFrame(trades, columns=["timestamp", "price", "amount", "side"])
+        df["datetime"] = pd.to_datetime(df["timestamp"], unit="ms")
+        df.set_index("datetime", inplace=True)
+        return df[["price", "amount", "side"]]
+
+    def fetch_bars(self, symbol: str = "BTC/USD", bar_type: str = "dollar", threshold: Optional[float] = None,
+                   freq: Optional[str] = None, since: Optional[int] = None, limit: int = 1000) -> pd.DataFrame:
+        trades = self.fetch_trades(symbol, since=since, limit=limit)
+        if bar_type == "time":
+            return time_bars(trades, freq or "1h")
+        if threshold is None:
+            raise ValueError(f"{bar_type} bars require a threshold.")
+        if bar_type == "volume":
+            return volume_bars(trades, threshold)
+        if bar_type == "dollar":
+            return dollar_bars(trades, threshold)
+        raise ValueError(f"Unsupported bar type '{bar_type}'. Use time, volume, or dollar.")
+
     def get_latest_price(self, symbol: str = "BTC/USD") -> float:
         self._throttle()
-        ticker = self.exchange.fetch_ticker(symbol)
+        ticker = self.transport.fetch(
+            f"ccxt.{self.exchange_name}.ticker", {"symbol": symbol},
+            lambda: self.exchange.fetch_ticker(symbol))
         return ticker["last"]
 
     def get_summary_stats(self, symbol: str = "BTC/USD", timeframe: str = "1d", limit: int = 90) -> Dict[str, float]:
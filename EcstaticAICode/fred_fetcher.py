@@ -2,13 +2,17 @@ import pandas_datareader.data as web
 import pandas as pd
 import datetime
 from typing import Optional, Union, List, Dict
+from transport import LiveTransport, default_transport
 
 
 class FREDFetcher:
-    def __init__(self, start_date: Union[str, datetime.date] = "2010-01-01", end_date: Optional[Union[str, datetime.date]] = None):
+    def __init__(self, start_date: Union[str, datetime.date] = "2010-01-01", end_date: Optional[Union[str, datetime.date]] = None,
+                 transport: Optional[LiveTransport] = None):
         self.start_date = pd.to_datetime(start_date)
         self.end_date = pd.to_datetime(
             end_date) if end_date else datetime.datetime.today()
+        self._open_ended = end_date is None
+        self.transport = transport or default_transport()
         self.series_cache: Dict[str, pd.Series] = {}
 
     def fetch_series(self, series_id: str) -> pd.Series:
@@ -16,8 +20,12 @@ class FREDFetcher:
             return self.series_cache[series_id]
 
         try:
-            data = web.DataReader(
-                series_id, "fred", self.start_date, self.end_date)
+            # Open-ended requests are keyed without today's date so replays stay valid.
+            params = {"series": series_id, "start": self.start_date.date(),
+                      "end": None if self._open_ended else self.end_date.date()}
+            data = self.transport.fetch(
+                "fred.series", params,
+                lambda: web.DataReader(series_id, "fred", self.start_date, self.end_date))
             series = data[series_id].dropna()
             self.series_cache[series_id] = series
             return series
@@ -0,0 +1,156 @@
+import os
+import json
+import time
+import datetime
+import threading
+import yfinance as yf
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+from transport import LiveTransport, default_transport
+
+FUNDAMENTAL_KEYS = ["trailingPE", "forwardPE", "priceToBook",
+                    "marketCap", "dividendYield", "beta"]
+
+
+class RateLimiter:
+    def __init__(self, calls_per_second: float = 2.0):
+        self.interval = 1.0 / calls_per_second if calls_per_second > 0 else 0.0
+        self.next_call = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_call - now
+            self.next_call = max(now, self.next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class FundamentalsStore:
+    def __init__(self, path: str = "fundamentals_store", max_age_days: float = 1.0, max_workers: int = 8,
+                 calls_per_second: float = 2.0, fields: Optional[List[str]] = None,
+                 transport: Optional[LiveTransport] = None):
+        self.path = path
+        self.max_age = datetime.timedelta(days=max_age_days)
+        self.max_workers = max_workers
+        self.fields = fields or FUNDAMENTAL_KEYS
+        self.transport = transport or default_transport()
+        self.limiter = RateLimiter(calls_per_second)
+        self.lock = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+        self.latest: Dict[str, Dict[str, Any]] = {}
+        for date in self.snapshot_dates():
+            self.latest.update(self._read_snapshot(date))
+
+    def _snapshot_path(self, date: str) -> str:
+        return os.path.join(self.path, f"{date}.json")
+
+    def _read_snapshot(self, date: str) -> Dict[str, Dict[str, Any]]:
+        path = self._snapshot_path(date)
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def _write_snapshot(self, records: Dict[str, Dict[str, Any]]):
+        date = datetime.date.today().isoformat()
+        with self.lock:
+            snapshot = self._read_snapshot(date)
+            snapshot.update(records)
+            tmp = f"{self._snapshot_path(date)}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(snapshot, f, indent=1, sort_keys=True)
+            os.replace(tmp, self._snapshot_path(date))
+            self.latest.update(records)
+
+    def snapshot_dates(self) -> List[str]:
+        return sorted(name[:-5] for name in os.listdir(self.path) if name.endswith(".json"))
+
+    def is_fresh(self, ticker: str) -> bool:
+        record = self.latest.get(ticker)
+        if record is None:
+            return False
+        fetched_at = datetime.datetime.fromisoformat(record["fetched_at"])
+        return datetime.datetime.now() - fetched_at <= self.max_age
+
+    def _fetch_one(self, ticker: str) -> Optional[Dict[str, Any]]:
+        if not self.transport.offline:
+            self.limiter.wait()
+        try:
+            info = self.transport.fetch(
+                "yfinance.info", {"ticker": ticker}, lambda: yf.Ticker(ticker).info)
+        except Exception as e:
+            print(f"[Warning] Failed to fetch fundamentals for {ticker}: {e}")
+            return None
+        return {
+            "fetched_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "values": {k: info.get(k, None) for k in self.fields},
+        }
+
+    def refresh(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        tickers = sorted({t.upper() for t in tickers})
+        if not tickers:
+            return {}
+
+        print(f"[Fundamentals] Fetching {len(tickers)} tickers with {self.max_workers} workers")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = dict(zip(tickers, pool.map(self._fetch_one, tickers)))
+
+        records = {t: r for t, r in results.items() if r is not None}
+        if records:
+            self._write_snapshot(records)
+        return records
+
+    def get_many(self, tickers: List[str], force: bool = False) -> Dict[str, Dict[str, Optional[float]]]:
+        tickers = [t.upper() for t in tickers]
+        stale = [t for t in tickers if force or not self.is_fresh(t)]
+        if stale:
+            self.refresh(stale)
+        return {t: dict(self.latest[t]["values"]) for t in tickers if t in self.latest}
+
+    def get(self, ticker: str, force: bool = False) -> Dict[str, Optional[float]]:
+        values = self.get_many([ticker], force=force)
+        return values.get(ticker.upper(), {k: None for k in self.fields})
+
+    def matrix(self, tickers: List[str], fields: Optional[List[str]] = None,
+               force: bool = False) -> pd.DataFrame:
+        fields = fields or self.fields
+        values = self.get_many(tickers, force=force)
+        frame = pd.DataFrame.from_dict(values, orient="index")
+        frame = frame.reindex(index=[t.upper() for t in tickers], columns=fields)
+        # Non-numeric fields (e.g. sector) become NaN instead of failing the whole matrix.
+        return frame.apply(pd.to_numeric, errors="coerce").astype(float)
+
+    def as_of(self, date: Union[str, datetime.date], tickers: Optional[List[str]] = None,
+              fields: Optional[List[str]] = None) -> pd.DataFrame:
+        date = pd.Timestamp(date).date().isoformat()
+        records: Dict[str, Dict[str, Any]] = {}
+        for snapshot_date in self.snapshot_dates():
+            if snapshot_date > date:
+                break
+            records.update(self._read_snapshot(snapshot_date))
+
+        frame = pd.DataFrame.from_dict(
+            {t: r["values"] for t, r in records.items()}, orient="index")
+        index = [t.upper() for t in tickers] if tickers else sorted(records)
+        frame = frame.reindex(index=index, columns=fields or self.fields)
+        return frame.apply(pd.to_numeric, errors="coerce").astype(float)
+
+
+# Test block
+if __name__ == "__main__":
+    print("[Testing FundamentalsStore...]\n")
+
+    store = FundamentalsStore(max_age_days=1, calls_per_second=4)
+    universe = ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "JPM", "XOM"]
+
+    start = time.perf_counter()
+    print(store.matrix(universe))
+    print(f"\n[First read: {time.perf_counter() - start:.2f}s]")
+
+    start = time.perf_counter()
+    store.matrix(universe)
+    print(f"[Repeat read from store: {time.perf_counter() - start:.4f}s]")
@@ -0,0 +1,119 @@
+import hashlib
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple, Union
+from fred_fetcher import FREDFetcher
+
+# FRED stamps observations at the start of their period; these approximate how long
+# after that date the first print is published.
+DEFAULT_RELEASE_LAGS: Dict[str, str] = {
+    "GDP": "120D",
+    "GDPC1": "120D",
+    "CPIAUCSL": "45D",
+    "CPILFESL": "45D",
+    "PCEPI": "60D",
+    "UNRATE": "38D",
+    "PAYEMS": "38D",
+    "INDPRO": "47D",
+    "FEDFUNDS": "35D",
+    "DGS10": "1D",
+    "DGS2": "1D",
+    "T10Y2Y": "1D",
+}
+
+
+def _naive_ns(index: pd.Index) -> np.ndarray:
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.as_unit("ns").asi8
+
+
+class MacroAligner:
+    def __init__(self, fred: Optional[FREDFetcher] = None,
+                 release_lags: Optional[Dict[str, Union[str, pd.Timedelta]]] = None):
+        self.fred = fred or FREDFetcher()
+        self.release_lags = {**DEFAULT_RELEASE_LAGS, **(release_lags or {})}
+        self._cache: Dict[Tuple, pd.DataFrame] = {}
+
+    def release_lag(self, series_id: str, series: pd.Series) -> pd.Timedelta:
+        if series_id in self.release_lags:
+            return pd.Timedelta(self.release_lags[series_id])
+        # Unknown series: assume the value is usable once its own period has ended.
+        spacing = np.diff(_naive_ns(series.index))
+        return pd.Timedelta(int(np.median(spacing)) if len(spacing) else 0)
+
+    def _availability(self, series_ids: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        stamps, values, columns = [], [], []
+        for j, sid in enumerate(series_ids):
+            series = self.fred.fetch_series(sid).dropna().sort_index()
+            lag = self.release_lag(sid, series)
+            stamps.append(_naive_ns(series.index) + lag.value)
+            values.append(series.to_numpy(dtype=np.float64))
+            columns.append(np.full(len(series), j))
+
+        ts = np.concatenate(stamps)
+        order = np.argsort(ts, kind="stable")
+        ts = ts[order]
+        col = np.concatenate(columns)[order]
+        val = np.concatenate(values)[order]
+
+        # One row per release event, forward-filled per column so each row holds
+        # the latest value of every series known at that instant.
+        rows = np.arange(len(ts))
+        matrix = np.full((len(ts), len(series_ids)), np.nan)
+        matrix[rows, col] = val
+        last = np.where(~np.isnan(matrix), rows[:, None], -1)
+        last = np.maximum.accumulate(last, axis=0)
+        filled = np.where(last >= 0, matrix[np.maximum(last, 0), np.arange(len(series_ids))], np.nan)
+        return ts, filled
+
+    def _cache_key(self, series_ids: List[str], index: np.ndarray) -> Tuple:
+        lags = tuple(str(self.release_lags.get(sid)) for sid in series_ids)
+        digest = hashlib.sha1(index.tobytes()).hexdigest()
+        return tuple(series_ids), lags, digest
+
+    def align(self, series_ids: List[str], index: pd.Index) -> pd.DataFrame:
+        target = _naive_ns(index)
+        key = self._cache_key(series_ids, target)
+        if key in self._cache:
+            return self._cache[key].copy()
+
+        print(f"[MacroAligner] As-of joining {len(series_ids)} series onto {len(target):,} timestamps")
+        ts, filled = self._availability(series_ids)
+        if len(ts) == 0:
+            aligned = np.full((len(target), len(series_ids)), np.nan)
+        else:
+            pos = np.searchsorted(ts, target, side="right") - 1
+            aligned = np.where((pos >= 0)[:, None], filled[np.maximum(pos, 0)], np.nan)
+
+        frame = pd.DataFrame(aligned, index=index, columns=series_ids)
+        self._cache[key] = frame
+        return frame.copy()
+
+    def join(self, prices: pd.DataFrame, series_ids: List[str]) -> pd.DataFrame:
+        macro = self.align(series_ids, prices.index)
+        if isinstance(prices.columns, pd.MultiIndex):
+            prices = prices.copy()
+            prices.columns = prices.columns.get_level_values(0)
+        return prices.join(macro)
+
+    def clear_cache(self):
+        self._cache.clear()
+
+
+# Test block
+if __name__ == "__main__":
+    print("[Testing MacroAligner...]")
+
+    aligner = MacroAligner(FREDFetcher(start_date="2015-01-01"))
+    prices = pd.DataFrame(
+        {"Close": np.linspace(100, 200, 2000)},
+        index=pd.bdate_range("2016-01-01", periods=2000, name="Date"),
+    )
+
+    joined = aligner.join(prices, ["CPIAUCSL", "UNRATE", "FEDFUNDS", "GDP"])
+    print(joined.tail())
+
+    print("\n[CPI print dated 2020-01-01 becomes visible 45 days later]")
+    print(joined.loc["2020-02-12":"2020-02-18", ["CPIAUCSL"]])
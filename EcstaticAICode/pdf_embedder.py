@@ -1,10 +1,13 @@
 import os
+import re
+import json
 import glob
 from langchain_community.document_loaders import PyPDFLoader
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
 from langchain_openai import OpenAIEmbeddings
-from typing import List
+import numpy as np
+from typing import Dict, List, Optional
 
 # --- Set your OpenAI API key here ---
 os.environ["OPENAI_API_KEY"] = ""
@@ -41,6 +44,49 @@ class PDFEmbedder:
         self.vector_store = FAISS.from_documents(chunks, embeddings)
         self.vector_store.save_local(save_path)
 
+    def embed_and_store_partitioned(self, chunks: List, save_path: str = "faiss_index",
+                                    partition_key: str = "source", topics: Optional[Dict[str, str]] = None,
+                                    include_full_index: bool = True):
+        print(f"[Embedding chunks into per-{partition_key} FAISS partitions...]")
+        topics = topics or {}
+        embeddings = OpenAIEmbeddings()
+        # Embed every chunk once; the full index and the partitions share these vectors.
+        vectors = embeddings.embed_documents([chunk.page_content for chunk in chunks])
+
+        groups: Dict[str, List] = {}
+        for chunk, vector in zip(chunks, vectors):
+            label = str(chunk.metadata.get(partition_key, "unknown"))
+            name = re.sub(r"[^A-Za-z0-9_-]+", "_",
+                          os.path.splitext(os.path.basename(label))[0]).strip("_") or "unknown"
+            chunk.metadata["partition"] = name
+            if name in topics:
+                chunk.metadata["topic"] = topics[name]
+            groups.setdefault(name, []).append((chunk, vector))
+
+        if include_full_index:
+            self.vector_store = FAISS.from_embeddings(
+                [(c.page_content, v) for c, v in zip(chunks, vectors)], embeddings,
+                metadatas=[c.metadata for c in chunks])
+            self.vector_store.save_local(save_path)
+
+        partition_root = os.path.join(save_path, "partitions")
+        manifest = {}
+        for name, pairs in groups.items():
+            print(f" - {name}: {len(pairs)} chunks")
+            store = FAISS.from_embeddings(
+                [(c.page_content, v) for c, v in pairs], embeddings,
+                metadatas=[c.metadata for c, _ in pairs])
+            store.save_local(os.path.join(partition_root, name))
+            manifest[name] = {
+                "source": pairs[0][0].metadata.get(partition_key),
+                "topic": topics.get(name),
+                "chunks": len(pairs),
+                "centroid": np.mean([v for _, v in pairs], axis=0).tolist(),
+            }
+
+        with open(os.path.join(partition_root, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
+
     def load_index(self, save_path: str = "faiss_index"):
         embeddings = OpenAIEmbeddings()
         self.vector_store = FAISS.load_local(save_path, embeddings)
@@ -53,6 +99,6 @@ if __name__ == "__main__":
     embedder = PDFEmbedder(pdf_folder="./finance_books")
     docs = embedder.load_pdfs()
     chunks = embedder.chunk_documents(docs)
-    embedder.embed_and_store(chunks, save_path="faiss_index")
+    embedder.embed_and_store_partitioned(chunks, save_path="faiss_index")
 
-    print("\n[FAISS index created and stored at ./faiss_index]")
+    print("\n[FAISS index and per-source partitions stored at ./faiss_index]")
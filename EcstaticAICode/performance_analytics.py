@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Union
+
+
+def drawdown_matrix(equity: np.ndarray, axis: int = 0) -> np.ndarray:
+    # Starting capital counts as the first peak, so an opening loss is a drawdown.
+    peak = np.maximum(np.maximum.accumulate(equity, axis=axis), 1.0)
+    return equity / peak - 1
+
+
+def annualized_sharpe(mean: np.ndarray, std: np.ndarray, periods_per_year: int = 252) -> np.ndarray:
+    # Shared by the analytics table and the significance tests so both report the same number.
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(std > 0, mean / std * np.sqrt(periods_per_year), np.nan)
+
+
+class PerformanceAnalytics:
+    def __init__(self, returns: Union[pd.Series, pd.DataFrame], positions: Optional[Union[pd.Series, pd.DataFrame]] = None,
+                 periods_per_year: int = 252, risk_free_rate: float = 0.0, rolling_window: int = 63):
+        if isinstance(returns, pd.Series):
+            returns = returns.to_frame(name=returns.name or "Strategy")
+        if isinstance(positions, pd.Series):
+            positions = positions.to_frame(name=returns.columns[0])
+
+        self.index = returns.index
+        self.columns = returns.columns
+        self.values = returns.to_numpy(dtype=np.float64)
+        self.positions = None if positions is None else positions.reindex(
+            index=self.index, columns=self.columns).to_numpy(dtype=np.float64)
+        self.periods_per_year = periods_per_year
+        self.risk_free_rate = risk_free_rate
+        self.rolling_window = rolling_window
+        self._equity = None
+        self._drawdown = None
+
+    @property
+    def equity(self) -> np.ndarray:
+        if self._equity is None:
+            self._equity = np.cumprod(1 + np.nan_to_num(self.values), axis=0)
+        return self._equity
+
+    @property
+    def drawdown(self) -> np.ndarray:
+        if self._drawdown is None:
+            self._drawdown = drawdown_matrix(self.equity)
+        return self._drawdown
+
+    def compute(self) -> pd.DataFrame:
+        r = self.values
+        valid = ~np.isnan(r)
+        count = valid.sum(axis=0)
+        ppy = self.periods_per_year
+        rf = self.risk_free_rate / ppy
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            excess = np.where(valid, r - rf, 0.0)
+            mean = excess.sum(axis=0) / count
+            dev = np.where(valid, excess - mean, 0.0)
+            std = np.sqrt((dev * dev).sum(axis=0) / (count - 1))
+            downside = np.sqrt((np.minimum(excess, 0.0) ** 2).sum(axis=0) / count)
+
+            total = self.equity[-1] - 1
+            annualized = (1 + total) ** (ppy / count) - 1
+            volatility = std * np.sqrt(ppy)
+            max_dd = self.drawdown.min(axis=0)
+
+            steps = np.arange(len(r))[:, None]
+            under = self.drawdown < 0
+            last_peak = np.maximum.accumulate(np.where(under, -1, steps), axis=0)
+            duration = np.where(under, steps - last_peak, 0).max(axis=0)
+
+            active = valid & (r != 0)
+            hit_rate = (active & (r > 0)).sum(axis=0) / active.sum(axis=0)
+
+            metrics = {
+                "Total Return": total,
+                "Annualized Return": annualized,
+                "Volatility": volatility,
+                "Sharpe Ratio": annualized_sharpe(mean, std, ppy),
+                "Sortino Ratio": np.where(downside > 0, mean / downside * np.sqrt(ppy), np.nan),
+                "Max Drawdown": max_dd,
+                "Calmar Ratio": np.where(max_dd < 0, annualized / -max_dd, np.nan),
+                "Max Drawdown Duration": duration,
+                "Hit Rate": hit_rate,
+            }
+
+            if self.positions is not None:
+                trades = np.abs(np.diff(np.nan_to_num(self.positions), axis=0))
+                metrics["Turnover"] = trades.mean(axis=0) * ppy if len(trades) else np.zeros(len(self.columns))
+
+        return pd.DataFrame(metrics, index=self.columns)
+
+    def rolling_sharpe(self, window: Optional[int] = None) -> pd.DataFrame:
+        window = window or self.rolling_window
+        r = np.nan_to_num(self.values) - self.risk_free_rate / self.periods_per_year
+        out = np.full_like(r, np.nan)
+        if window <= len(r):
+            s1 = np.vstack([np.zeros((1, r.shape[1])), np.cumsum(r, axis=0)])
+            s2 = np.vstack([np.zeros((1, r.shape[1])), np.cumsum(r * r, axis=0)])
+            sums = s1[window:] - s1[:-window]
+            sqs = s2[window:] - s2[:-window]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = sums / window
+                std = np.sqrt(np.maximum((sqs - sums * mean) / (window - 1), 0.0))
+                out[window - 1:] = annualized_sharpe(mean, std, self.periods_per_year)
+        return pd.DataFrame(out, index=self.index, columns=self.columns)
+
+    def drawdowns(self) -> pd.DataFrame:
+        return pd.DataFrame(self.drawdown, index=self.index, columns=self.columns)
+
+
+# Test block
+if __name__ == "__main__":
+    import time
+
+    print("[Testing PerformanceAnalytics...]")
+
+    np.random.seed(42)
+    n_periods, n_strategies = 2520, 5000
+    index = pd.bdate_range("2015-01-01", periods=n_periods)
+    positions = pd.DataFrame(np.sign(np.random.randn(n_periods, n_strategies)), index=index)
+    market = np.random.normal(0.0004, 0.012, (n_periods, 1))
+    returns = positions.shift().fillna(0) * market
+
+    start = time.perf_counter()
+    analytics = PerformanceAnalytics(returns, positions=positions)
+    table = analytics.compute()
+    rolling = analytics.rolling_sharpe()
+    print(f"\n[{n_strategies:,} strategies x {n_periods:,} periods in {time.perf_counter() - start:.2f}s]")
+
+    print("\n[Top 5 by Sharpe]")
+    print(table.sort_values("Sharpe Ratio", ascending=False).head())
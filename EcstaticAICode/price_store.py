@@ -0,0 +1,144 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Union
+
+PRICE_COLUMNS = {"open", "high", "low", "close", "adj close", "price", "vwap"}
+
+
+class PriceStore:
+    def __init__(self, timestamps: np.ndarray, columns: Dict[str, np.ndarray], index_name: str = "Date"):
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.columns = dict(columns)
+        self.index_name = index_name
+
+        for name, values in self.columns.items():
+            if len(values) != len(self.timestamps):
+                raise ValueError(
+                    f"Column '{name}' has {len(values)} rows, expected {len(self.timestamps)}")
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, dtype: Union[str, np.dtype] = np.float32) -> "PriceStore":
+        if isinstance(df.columns, pd.MultiIndex):
+            df = df.copy(deep=False)
+            df.columns = df.columns.get_level_values(0)
+
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_convert("UTC").tz_localize(None)
+        timestamps = index.as_unit("ns").asi8
+
+        # Only prices are narrowed; volumes and counts keep their native precision.
+        columns = {
+            str(name): np.ascontiguousarray(
+                df[name].to_numpy(dtype=dtype) if str(name).lower() in PRICE_COLUMNS else df[name].to_numpy())
+            for name in df.columns
+        }
+        return cls(timestamps, columns, index_name=df.index.name or "Date")
+
+    @classmethod
+    def open(cls, path: str, mmap_mode: Optional[str] = "r") -> "PriceStore":
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+
+        timestamps = np.load(os.path.join(
+            path, "timestamps.npy"), mmap_mode=mmap_mode)
+        columns = {
+            name: np.load(os.path.join(path, f"{i}.npy"), mmap_mode=mmap_mode)
+            for i, name in enumerate(meta["columns"])
+        }
+        return cls(timestamps, columns, index_name=meta["index_name"])
+
+    def save(self, path: str) -> str:
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "timestamps.npy"), self.timestamps)
+        for i, values in enumerate(self.columns.values()):
+            np.save(os.path.join(path, f"{i}.npy"), values)
+
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump({"columns": list(self.columns),
+                      "index_name": self.index_name}, f)
+        return path
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def __contains__(self, column: str) -> bool:
+        return column in self.columns
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.columns)
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(self.timestamps.view("datetime64[ns]"), name=self.index_name)
+
+    def select(self, columns: List[str]) -> "PriceStore":
+        return PriceStore(self.timestamps, {c: self.columns[c] for c in columns}, self.index_name)
+
+    def iloc(self, start: Optional[int] = None, stop: Optional[int] = None) -> "PriceStore":
+        window = slice(start, stop)
+        return PriceStore(
+            self.timestamps[window],
+            {name: values[window] for name, values in self.columns.items()},
+            self.index_name,
+        )
+
+    def between(self, start=None, end=None) -> "PriceStore":
+        lo = 0 if start is None else np.searchsorted(
+            self.timestamps, pd.Timestamp(start).value, side="left")
+        hi = len(self) if end is None else np.searchsorted(
+            self.timestamps, pd.Timestamp(end).value, side="right")
+        return self.iloc(lo, hi)
+
+    def tail(self, n: int = 5) -> "PriceStore":
+        return self.iloc(max(len(self) - n, 0), None)
+
+    def astype(self, dtype: Union[str, np.dtype]) -> "PriceStore":
+        return PriceStore(
+            self.timestamps,
+            {name: values.astype(dtype, copy=False)
+             for name, values in self.columns.items()},
+            self.index_name,
+        )
+
+    def nbytes(self) -> int:
+        return self.timestamps.nbytes + sum(v.nbytes for v in self.columns.values())
+
+    def to_pandas(self, dtype: Optional[Union[str, np.dtype]] = np.float64) -> pd.DataFrame:
+        data = {
+            name: values.astype(dtype, copy=False) if dtype is not None and values.dtype.kind == "f" else values
+            for name, values in self.columns.items()
+        }
+        return pd.DataFrame(data, index=self.index, copy=False)
+
+
+# Test block
+if __name__ == "__main__":
+    import tempfile
+
+    print("[Testing PriceStore...]")
+
+    np.random.seed(42)
+    index = pd.date_range("2024-01-01", periods=252, freq="B", name="Date")
+    close = 100 * np.cumprod(1 + np.random.normal(0.0005, 0.01, len(index)))
+    frame = pd.DataFrame({"Open": close, "High": close * 1.01, "Low": close * 0.99,
+                          "Close": close, "Volume": np.random.randint(1e6, 5e6, len(index))}, index=index)
+
+    store = PriceStore.from_frame(frame)
+    print(f"\n[float64 frame: {frame.memory_usage().sum():,} bytes, "
+          f"float32 store: {store.nbytes():,} bytes]")
+
+    print("\n[Window view: 2024-06]")
+    print(store.between("2024-06-01", "2024-06-30").to_pandas().head())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store.save(tmp)
+        mapped = PriceStore.open(tmp)
+        print("\n[Memory-mapped tail]")
+        print(mapped.tail().to_pandas())
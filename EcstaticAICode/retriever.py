@@ -1,27 +1,110 @@
 import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from langchain_community.vectorstores import FAISS
 from langchain_community.embeddings import OpenAIEmbeddings
 from langchain_core.documents import Document
-from typing import List, Optional, Any
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from typing import Dict, List, Optional, Any
 
 # Set your API key securely
 os.environ["OPENAI_API_KEY"] = ""
 
 
 class PDFRetriever:
-    def __init__(self, faiss_path: str = "faiss_index", embeddings: Optional[Any] = None):
+    def __init__(self, faiss_path: str = "faiss_index", embeddings: Optional[Any] = None, max_workers: int = 8,
+                 max_partitions: int = 3):
         print(f"[Retriever] Loading FAISS index from '{faiss_path}'...")
         if embeddings is None:
             from langchain_openai import OpenAIEmbeddings
             embeddings = OpenAIEmbeddings()
-        self.vector_store = FAISS.load_local(
-            faiss_path, embeddings, allow_dangerous_deserialization=True
-        )
-        self.retriever = self.vector_store.as_retriever()
+        self.embeddings = embeddings
+        self.max_workers = max_workers
+        self.max_partitions = max_partitions
 
-    def search(self, query: str, k: int = 5) -> List[Document]:
+        self.vector_store = None
+        self.retriever = None
+        if os.path.exists(os.path.join(faiss_path, "index.faiss")):
+            self.vector_store = FAISS.load_local(
+                faiss_path, embeddings, allow_dangerous_deserialization=True
+            )
+            self.retriever = self.vector_store.as_retriever()
+
+        self.manifest: Dict[str, Dict[str, Any]] = {}
+        self.partitions: Dict[str, FAISS] = {}
+        self.centroids: Dict[str, np.ndarray] = {}
+        manifest_path = os.path.join(faiss_path, "partitions", "manifest.json")
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                self.manifest = json.load(f)
+            for name in self.manifest:
+                self.partitions[name] = FAISS.load_local(
+                    os.path.join(faiss_path, "partitions", name), embeddings,
+                    allow_dangerous_deserialization=True
+                )
+                centroid = self.manifest[name].get("centroid")
+                if centroid is None:
+                    index = self.partitions[name].index
+                    centroid = index.reconstruct_n(0, index.ntotal).mean(axis=0)
+                self.centroids[name] = np.asarray(centroid, dtype=np.float32)
+            print(f"[Retriever] Loaded {len(self.partitions)} partitions")
+
+        if self.vector_store is None and not self.partitions:
+            raise FileNotFoundError(f"No FAISS index or partitions found at '{faiss_path}'")
+
+    def route(self, query: str, sources: Optional[List[str]] = None,
+              topics: Optional[List[str]] = None, vector: Optional[List[float]] = None) -> List[str]:
+        names = list(self.partitions)
+        if sources:
+            wanted = set(sources)
+            names = [n for n in names if n in wanted or self.manifest[n].get("source") in wanted]
+        if topics:
+            wanted = {t.lower() for t in topics}
+            names = [n for n in names if (self.manifest[n].get("topic") or "").lower() in wanted]
+        if sources or topics:
+            return names
+
+        query_lower = query.lower()
+        matched = [
+            n for n in names
+            if n.replace("_", " ").lower() in query_lower
+            or (self.manifest[n].get("topic") and self.manifest[n]["topic"].lower() in query_lower)
+        ]
+        if matched or len(names) <= self.max_partitions:
+            return matched or names
+
+        # No partition named in the query: pick the ones whose centroid sits closest to it.
+        if vector is None:
+            vector = self.embeddings.embed_query(query)
+        vector = np.asarray(vector, dtype=np.float32)
+        distances = {n: float(np.sum((self.centroids[n] - vector) ** 2)) for n in names}
+        return sorted(names, key=distances.get)[:self.max_partitions]
+
+    def search(self, query: str, k: int = 5, sources: Optional[List[str]] = None,
+               topics: Optional[List[str]] = None) -> List[Document]:
         print(f"\n[Retriever] Searching top {k} documents for query: {query}")
-        return self.retriever.invoke(query, k=k)
+        if not self.partitions:
+            return self.retriever.invoke(query, k=k)
+
+        vector = self.embeddings.embed_query(query)
+        names = self.route(query, sources, topics, vector=vector)
+        if not names:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(names))) as pool:
+            results = pool.map(
+                lambda n: self.partitions[n].similarity_search_with_score_by_vector(vector, k=k), names)
+            hits = [hit for partition_hits in results for hit in partition_hits]
+
+        # All partitions share one embedding model, so L2 distances are comparable.
+        hits.sort(key=lambda hit: hit[1])
+        return [doc for doc, _ in hits[:k]]
+
+    def as_retriever(self, k: int = 3, sources: Optional[List[str]] = None,
+                     topics: Optional[List[str]] = None) -> BaseRetriever:
+        return PartitionedRetriever(pdf_retriever=self, k=k, sources=sources, topics=topics)
 
     def pretty_print_results(self, docs: List[Document]):
         for i, doc in enumerate(docs):
@@ -31,6 +114,16 @@ class PDFRetriever:
                 print("\n[Metadata]", doc.metadata)
 
 
+class PartitionedRetriever(BaseRetriever):
+    pdf_retriever: Any
+    k: int = 3
+    sources: Optional[List[str]] = None
+    topics: Optional[List[str]] = None
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> List[Document]:
+        return self.pdf_retriever.search(query, k=self.k, sources=self.sources, topics=self.topics)
+
+
 # Test block
 if __name__ == "__main__":
     print("[Testing PDFRetriever...]")
@@ -41,3 +134,6 @@ if __name__ == "__main__":
     docs = retriever.search(sample_question, k=3)
 
     retriever.pretty_print_results(docs)
+
+    if retriever.partitions:
+        print(f"\n[Partitions routed for query] {retriever.route(sample_question)}")
@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 from typing import Dict, Union, Optional
+from performance_analytics import PerformanceAnalytics
 
 
 class RiskModel:
@@ -13,8 +14,8 @@ class RiskModel:
         self.risk_free_rate = risk_free_rate
 
     def sharpe_ratio(self) -> pd.Series:
-        excess_returns = self.returns.sub(self.risk_free_rate / 252)
-        return excess_returns.mean() / excess_returns.std()
+        # Annualized excess-return Sharpe, the same figure reported by performance_summary.
+        return self.performance_summary()["Sharpe Ratio"]
 
     def beta(self, market_returns: pd.Series) -> pd.Series:
         betas = {}
@@ -41,13 +42,10 @@ class RiskModel:
         return self.returns[self.returns.lt(self.value_at_risk(confidence_level))].mean()
 
     def max_drawdown(self) -> pd.Series:
-        drawdowns = {}
-        for asset in self.returns.columns:
-            cum_returns = (1 + self.returns[asset]).cumprod()
-            peak = cum_returns.cummax()
-            dd = (cum_returns - peak) / peak
-            drawdowns[asset] = dd.min()
-        return pd.Series(drawdowns)
+        return self.performance_summary()["Max Drawdown"]
+
+    def performance_summary(self) -> pd.DataFrame:
+        return PerformanceAnalytics(self.returns, risk_free_rate=self.risk_free_rate).compute()
 
     def capm(self, market_returns: pd.Series) -> pd.DataFrame:
         betas = self.beta(market_returns)
@@ -84,6 +82,9 @@ if __name__ == "__main__":
     print("\n[Max Drawdown]")
     print(model.max_drawdown())
 
+    print("\n[Performance Summary]")
+    print(model.performance_summary().T)
+
     print("\n[Value at Risk (95%)]")
     print(model.value_at_risk())
 
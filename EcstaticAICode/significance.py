@@ -0,0 +1,204 @@
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from statistics import NormalDist
+from typing import Callable, Dict, Optional, Sequence
+from performance_analytics import annualized_sharpe, drawdown_matrix
+
+EULER_GAMMA = 0.5772156649015329
+METRICS = ["Sharpe Ratio", "Annualized Return", "Max Drawdown"]
+
+
+def stationary_bootstrap_indices(rng: np.random.Generator, n_samples: int, n: int,
+                                 block_size: float) -> np.ndarray:
+    # Politis-Romano: each step starts a new block with probability 1/block_size.
+    # Offsets from the most recent block start replace the sequential walk.
+    starts = rng.integers(0, n, size=(n_samples, n))
+    new_block = rng.random((n_samples, n)) < 1.0 / block_size
+    new_block[:, 0] = True
+    steps = np.arange(n)
+    last = np.maximum.accumulate(np.where(new_block, steps, 0), axis=1)
+    origin = np.take_along_axis(starts, last, axis=1)
+    return (origin + steps - last) % n
+
+
+def block_bootstrap_indices(rng: np.random.Generator, n_samples: int, n: int,
+                            block_size: int) -> np.ndarray:
+    block_size = max(int(block_size), 1)
+    n_blocks = -(-n // block_size)
+    starts = rng.integers(0, n, size=(n_samples, n_blocks))
+    offsets = np.arange(n_blocks * block_size) % block_size
+    idx = np.repeat(starts, block_size, axis=1) + offsets
+    return idx[:, :n] % n
+
+
+def path_metrics(returns: np.ndarray, periods_per_year: int = 252) -> Dict[str, np.ndarray]:
+    returns = np.atleast_2d(returns)
+    n = returns.shape[1]
+    mean = returns.mean(axis=1)
+    std = returns.std(axis=1, ddof=1)
+    growth = np.cumprod(1 + returns, axis=1)
+    total = growth[:, -1] - 1
+    drawdown = drawdown_matrix(growth, axis=1)
+    sharpe = annualized_sharpe(mean, std, periods_per_year)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        annualized = (1 + total) ** (periods_per_year / n) - 1
+    return {
+        "Sharpe Ratio": sharpe,
+        "Annualized Return": annualized,
+        "Max Drawdown": drawdown.min(axis=1),
+    }
+
+
+def _run_chunked(func: Callable[[np.random.Generator, int], Dict[str, np.ndarray]], n_resamples: int,
+                 chunk_size: int, n_jobs: Optional[int], seed: Optional[int]) -> Dict[str, np.ndarray]:
+    sizes = [min(chunk_size, n_resamples - i) for i in range(0, n_resamples, chunk_size)]
+    generators = [np.random.default_rng(s)
+                  for s in np.random.SeedSequence(seed).spawn(len(sizes))]
+    workers = n_jobs or min(len(sizes), os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(func, generators, sizes))
+    return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+
+
+class SignificanceTester:
+    def __init__(self, strategy_returns: pd.Series, position: Optional[pd.Series] = None,
+                 market_returns: Optional[pd.Series] = None, periods_per_year: int = 252):
+        self.returns = np.asarray(pd.Series(strategy_returns).dropna(), dtype=np.float64)
+        self.position = None if position is None else np.asarray(position, dtype=np.float64)
+        self.market_returns = None if market_returns is None else np.asarray(market_returns, dtype=np.float64)
+        self.periods_per_year = periods_per_year
+        self.observed = {k: float(v[0]) for k, v in path_metrics(
+            self.returns, periods_per_year).items()}
+
+    def bootstrap(self, n_resamples: int = 10000, method: str = "stationary",
+                  block_size: Optional[float] = None, confidence: float = 0.95,
+                  chunk_size: int = 1000, n_jobs: Optional[int] = None,
+                  seed: Optional[int] = None) -> pd.DataFrame:
+        r = self.returns
+        n = len(r)
+        block_size = block_size or max(1.0, n ** (1 / 3))
+        centered = r - r.mean()
+
+        if method == "stationary":
+            draw = stationary_bootstrap_indices
+        elif method == "block":
+            draw = block_bootstrap_indices
+        else:
+            raise ValueError(f"Unknown bootstrap method '{method}'. Use stationary or block.")
+
+        def chunk(rng: np.random.Generator, size: int) -> Dict[str, np.ndarray]:
+            idx = draw(rng, size, n, block_size)
+            sample = path_metrics(r[idx], self.periods_per_year)
+            null = path_metrics(centered[idx], self.periods_per_year)
+            return {**sample, **{f"null {k}": v for k, v in null.items()}}
+
+        print(f"[Significance] Running {n_resamples:,} {method} bootstrap resamples...")
+        draws = _run_chunked(chunk, n_resamples, chunk_size, n_jobs, seed)
+
+        alpha = (1 - confidence) / 2
+        rows = {}
+        for metric in METRICS:
+            values = draws[metric]
+            null = draws[f"null {metric}"]
+            observed = self.observed[metric]
+            # Drawdown is always <= 0, so "better" means closer to zero for every metric.
+            p_value = (1 + np.sum(null >= observed)) / (1 + len(null))
+            rows[metric] = {
+                "Estimate": observed,
+                "CI Low": np.nanquantile(values, alpha),
+                "CI High": np.nanquantile(values, 1 - alpha),
+                "Std Error": np.nanstd(values, ddof=1),
+                "p-value": p_value,
+            }
+        return pd.DataFrame(rows).T
+
+    def permutation_test(self, n_permutations: int = 10000, transaction_costs: Optional[np.ndarray] = None,
+                         chunk_size: int = 1000, n_jobs: Optional[int] = None,
+                         seed: Optional[int] = None) -> pd.DataFrame:
+        if self.position is None or self.market_returns is None:
+            raise ValueError("Permutation test needs the position and market returns behind the strategy.")
+
+        position = self.position
+        market = self.market_returns
+        costs = np.zeros_like(market) if transaction_costs is None else np.asarray(transaction_costs)
+
+        def chunk(rng: np.random.Generator, size: int) -> Dict[str, np.ndarray]:
+            perm = rng.random((size, len(market))).argsort(axis=1)
+            shuffled = position * market[perm] - costs
+            return path_metrics(shuffled, self.periods_per_year)
+
+        print(f"[Significance] Running {n_permutations:,} Monte Carlo permutations...")
+        draws = _run_chunked(chunk, n_permutations, chunk_size, n_jobs, seed)
+
+        rows = {}
+        for metric in METRICS:
+            observed = self.observed[metric]
+            rows[metric] = {
+                "Estimate": observed,
+                "Null Mean": np.nanmean(draws[metric]),
+                "p-value": (1 + np.sum(draws[metric] >= observed)) / (1 + n_permutations),
+            }
+        return pd.DataFrame(rows).T
+
+    def deflated_sharpe(self, n_trials: int = 1, trial_sharpes: Optional[Sequence[float]] = None,
+                        sharpe_variance: Optional[float] = None) -> Dict[str, float]:
+        r = self.returns
+        t = len(r)
+        sr = r.mean() / r.std(ddof=1)
+        dev = r - r.mean()
+        skew = np.mean(dev ** 3) / np.mean(dev ** 2) ** 1.5
+        kurt = np.mean(dev ** 4) / np.mean(dev ** 2) ** 2
+        spread = 1 - skew * sr + (kurt - 1) / 4 * sr ** 2
+
+        if trial_sharpes is not None:
+            trials = np.asarray(trial_sharpes, dtype=np.float64) / np.sqrt(self.periods_per_year)
+            n_trials = max(n_trials, len(trials))
+            variance = trials.var(ddof=1)
+        elif sharpe_variance is not None:
+            variance = sharpe_variance / self.periods_per_year
+        else:
+            variance = spread / (t - 1)
+
+        norm = NormalDist()
+        if n_trials > 1:
+            sr0 = np.sqrt(variance) * ((1 - EULER_GAMMA) * norm.inv_cdf(1 - 1 / n_trials)
+                                       + EULER_GAMMA * norm.inv_cdf(1 - 1 / (n_trials * np.e)))
+        else:
+            sr0 = 0.0
+
+        z = (sr - sr0) * np.sqrt(t - 1) / np.sqrt(max(spread, 1e-12))
+        return {
+            "Sharpe Ratio": float(sr * np.sqrt(self.periods_per_year)),
+            "Expected Max Sharpe": float(sr0 * np.sqrt(self.periods_per_year)),
+            "Trials": n_trials,
+            "Deflated Sharpe": norm.cdf(z),
+            "p-value": 1 - norm.cdf(z),
+        }
+
+
+# Test block
+if __name__ == "__main__":
+    import time
+
+    print("[Testing SignificanceTester...]")
+
+    np.random.seed(42)
+    market = np.random.normal(0.0004, 0.012, 1260)
+    position = np.where(np.random.rand(1260) > 0.45, 1.0, -1.0)
+    strategy = pd.Series(position * market)
+
+    tester = SignificanceTester(strategy, position=position, market_returns=market)
+
+    start = time.perf_counter()
+    print(tester.bootstrap(n_resamples=10000, seed=7))
+    print(f"[Bootstrap took {time.perf_counter() - start:.2f}s]\n")
+
+    start = time.perf_counter()
+    print(tester.permutation_test(n_permutations=10000, seed=7))
+    print(f"[Permutation test took {time.perf_counter() - start:.2f}s]\n")
+
+    print("[Deflated Sharpe after 50 trials]")
+    print(tester.deflated_sharpe(n_trials=50))
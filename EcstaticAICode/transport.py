@@ -0,0 +1,137 @@
+import os
+import json
+import time
+import random
+import hashlib
+import threading
+import pandas as pd
+from typing import Any, Callable, Dict, Optional, Union
+
+FIXTURE_DIR = "fixtures"
+
+
+class FixtureNotFoundError(RuntimeError):
+    pass
+
+
+def fixture_key(namespace: str, params: Dict[str, Any]) -> str:
+    payload = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.sha1(f"{namespace}|{payload}".encode("utf-8")).hexdigest()[:16]
+    return f"{namespace.replace('/', '_')}-{digest}"
+
+
+class LiveTransport:
+    mode = "live"
+    offline = False
+
+    def fetch(self, namespace: str, params: Dict[str, Any], func: Callable[[], Any]) -> Any:
+        return func()
+
+
+class RecordingTransport(LiveTransport):
+    mode = "record"
+
+    def __init__(self, fixture_dir: str = FIXTURE_DIR):
+        self.fixture_dir = fixture_dir
+        os.makedirs(fixture_dir, exist_ok=True)
+
+    def fetch(self, namespace: str, params: Dict[str, Any], func: Callable[[], Any]) -> Any:
+        result = func()
+        key = fixture_key(namespace, params)
+        path = os.path.join(self.fixture_dir, f"{key}.pkl.gz")
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        pd.to_pickle({"namespace": namespace, "params": params, "result": result},
+                     tmp, compression="gzip")
+        os.replace(tmp, path)
+        return result
+
+
+class ReplayTransport(LiveTransport):
+    mode = "replay"
+    offline = True
+
+    def __init__(self, fixture_dir: str = FIXTURE_DIR,
+                 latency: Union[float, Dict[str, float], Callable[[str, Dict[str, Any]], float]] = 0.0,
+                 jitter: float = 0.0, seed: Optional[int] = None):
+        if not os.path.isdir(fixture_dir):
+            raise FixtureNotFoundError(f"Fixture directory '{fixture_dir}' does not exist")
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+        self._cache: Dict[str, Any] = {}
+
+    def _delay(self, namespace: str, params: Dict[str, Any]) -> float:
+        if callable(self.latency):
+            base = self.latency(namespace, params)
+        elif isinstance(self.latency, dict):
+            matches = [k for k in self.latency if namespace.startswith(k)]
+            base = self.latency[max(matches, key=len)] if matches else 0.0
+        else:
+            base = self.latency
+        if self.jitter:
+            base += self._rng.uniform(0, self.jitter)
+        return max(base, 0.0)
+
+    def fetch(self, namespace: str, params: Dict[str, Any], func: Callable[[], Any]) -> Any:
+        key = fixture_key(namespace, params)
+        if key not in self._cache:
+            path = os.path.join(self.fixture_dir, f"{key}.pkl.gz")
+            if not os.path.exists(path):
+                raise FixtureNotFoundError(
+                    f"No recorded fixture for {namespace} {params} (expected {path})")
+            self._cache[key] = pd.read_pickle(path, compression="gzip")["result"]
+
+        delay = self._delay(namespace, params)
+        if delay:
+            time.sleep(delay)
+
+        result = self._cache[key]
+        return result.copy() if hasattr(result, "copy") else result
+
+
+def default_transport() -> LiveTransport:
+    mode = os.environ.get("ECSTATICAI_TRANSPORT", "live").lower()
+    fixture_dir = os.environ.get("ECSTATICAI_FIXTURES", FIXTURE_DIR)
+
+    if mode == "record":
+        return RecordingTransport(fixture_dir)
+    if mode == "replay":
+        latency = float(os.environ.get("ECSTATICAI_REPLAY_LATENCY", 0.0))
+        return ReplayTransport(fixture_dir, latency=latency)
+    if mode != "live":
+        raise ValueError(f"Unknown transport mode '{mode}'. Use live, record, or replay.")
+    return LiveTransport()
+
+
+# Test block
+if __name__ == "__main__":
+    import tempfile
+    import numpy as np
+
+    print("[Testing Record/Replay Transport...]")
+
+    calls = {"n": 0}
+
+    def slow_download():
+        calls["n"] += 1
+        time.sleep(0.5)
+        index = pd.date_range("2024-01-01", periods=5, freq="D")
+        return pd.DataFrame({"Close": np.arange(5.0)}, index=index)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        params = {"ticker": "AAPL", "period": "1y", "interval": "1d"}
+
+        recorder = RecordingTransport(tmp)
+        recorded = recorder.fetch("yfinance.download", params, slow_download)
+
+        replay = ReplayTransport(tmp, latency={"yfinance": 0.01})
+        start = time.perf_counter()
+        replayed = replay.fetch("yfinance.download", params, slow_download)
+        print(f"\n[Replayed in {time.perf_counter() - start:.3f}s, network calls: {calls['n']}]")
+        print(f"Identical: {recorded.equals(replayed)}")
+
+        try:
+            replay.fetch("yfinance.download", {**params, "ticker": "MSFT"}, slow_download)
+        except FixtureNotFoundError as e:
+            print(f"\n[Missing fixture] {e}")
@@ -1,8 +1,10 @@
 from yfinance_fetcher import YFinanceFetcher
 from fred_fetcher import FREDFetcher
 from crypto_fetcher import CryptoFetcher
+from transport import LiveTransport, default_transport
+from macro_aligner import MacroAligner
 
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, List
 import pandas as pd
 
 
@@ -13,11 +15,14 @@ class UnifiedFinancialFetcher:
         fred_series: Optional[str] = None,
         crypto_exchange: str = "coinbase",
         crypto_symbol: str = "BTC/USD",
+        transport: Optional[LiveTransport] = None,
     ):
-        self.yf = YFinanceFetcher(yfinance_ticker or "AAPL")
-        self.fred = FREDFetcher()
-        self.crypto = CryptoFetcher(crypto_exchange)
+        self.transport = transport or default_transport()
+        self.yf = YFinanceFetcher(yfinance_ticker or "AAPL", transport=self.transport)
+        self.fred = FREDFetcher(transport=self.transport)
+        self.crypto = CryptoFetcher(crypto_exchange, transport=self.transport)
         self.crypto_symbol = crypto_symbol
+        self.macro_aligner = MacroAligner(self.fred)
 
     #STOCK METHODS
     def get_stock_summary(self) -> Dict[str, Any]:
@@ -39,6 +44,11 @@ class UnifiedFinancialFetcher:
     def get_macro_summary(self, series: str) -> Dict[str, float]:
         return self.fred.get_summary_stats(series)
 
+    def get_macro_aligned(self, series: List[str], price_data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        if price_data is None:
+            price_data = self.yf.get_price_data()
+        return self.macro_aligner.join(price_data, series)
+
     #CRYPTO METHODS
     def get_crypto_ohlcv(self, limit: int = 30, timeframe: str = "1d") -> pd.DataFrame:
         return self.crypto.fetch_ohlcv(self.crypto_symbol, timeframe, limit)
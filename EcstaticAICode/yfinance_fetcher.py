@@ -1,15 +1,22 @@
 import yfinance as yf
 import pandas as pd
 import numpy as np
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union
+from price_store import PriceStore
+from bar_resampler import time_bars
+from transport import LiveTransport, default_transport
+from fundamentals_store import FundamentalsStore, FUNDAMENTAL_KEYS
 
 
 class YFinanceFetcher:
-    def __init__(self, ticker: str, period: str = "1y", interval: str = "1d", verbose: bool = True):
+    def __init__(self, ticker: str, period: str = "1y", interval: str = "1d", verbose: bool = True,
+                 transport: Optional[LiveTransport] = None, fundamentals_store: Optional[FundamentalsStore] = None):
         self.ticker = ticker.upper()
         self.period = period
         self.interval = interval
         self.verbose = verbose
+        self.transport = transport or default_transport()
+        self.fundamentals_store = fundamentals_store
         self.data = self._download_data()
 
     def _download_data(self) -> pd.DataFrame:
@@ -17,8 +24,10 @@ class YFinanceFetcher:
             print(
                 f"[YF] Downloading {self.ticker} data for period '{self.period}' and interval '{self.interval}'")
         try:
-            df = yf.download(self.ticker, period=self.period,
-                             interval=self.interval)
+            df = self.transport.fetch(
+                "yfinance.download",
+                {"ticker": self.ticker, "period": self.period, "interval": self.interval},
+                lambda: yf.download(self.ticker, period=self.period, interval=self.interval))
             df.dropna(inplace=True)
             return df
         except Exception as e:
@@ -28,6 +37,12 @@ class YFinanceFetcher:
     def get_price_data(self) -> pd.DataFrame:
         return self.data[["Open", "High", "Low", "Close", "Volume"]]
 
+    def get_price_store(self, dtype: Union[str, np.dtype] = np.float32) -> PriceStore:
+        return PriceStore.from_frame(self.get_price_data(), dtype=dtype)
+
+    def get_resampled(self, freq: str = "1h") -> pd.DataFrame:
+        return time_bars(self.get_price_data(), freq)
+
     def get_returns(self, log: bool = False) -> pd.Series:
         prices = self.data["Close"]
         if log:
@@ -63,11 +78,11 @@ class YFinanceFetcher:
         return drawdown.min()
 
     def get_fundamentals(self) -> Dict[str, Optional[float]]:
-        ticker_obj = yf.Ticker(self.ticker)
-        info = ticker_obj.info
-        keys = ["trailingPE", "forwardPE", "priceToBook",
-                "marketCap", "dividendYield", "beta"]
-        return {k: info.get(k, None) for k in keys}
+        if self.fundamentals_store is not None:
+            return self.fundamentals_store.get(self.ticker)
+        info = self.transport.fetch(
+            "yfinance.info", {"ticker": self.ticker}, lambda: yf.Ticker(self.ticker).info)
+        return {k: info.get(k, None) for k in FUNDAMENTAL_KEYS}
 
     def refresh(self):
         self.data = self._download_data()